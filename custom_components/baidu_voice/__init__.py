@@ -1,20 +1,84 @@
 """Integration for Baidu Voice services."""
 
+import asyncio
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    ATTR_CPROFILE,
+    DATA_PROFILER,
+    DOMAIN,
+    SERVICE_START_PROFILING,
+    SERVICE_STOP_PROFILING,
+)
+from .profiler import BaiduVoiceProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["stt", "tts"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+START_PROFILING_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CPROFILE, default=True): cv.boolean}
+)
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """设置百度语音集成."""
+
+    # 串行处理启动/停止, 避免并发调用重复开启 tracemalloc
+    profiling_lock = asyncio.Lock()
+
+    async def _async_start_profiling(call: ServiceCall) -> None:
+        """开始性能分析."""
+        async with profiling_lock:
+            if hass.data.get(DATA_PROFILER) is not None:
+                raise HomeAssistantError("Profiling is already running")
+
+            profiler = BaiduVoiceProfiler(hass, call.data[ATTR_CPROFILE])
+            await hass.async_add_executor_job(profiler.start)
+            hass.data[DATA_PROFILER] = profiler
+
+    async def _async_stop_profiling(call: ServiceCall) -> ServiceResponse:
+        """停止性能分析并写入结果文件."""
+        async with profiling_lock:
+            profiler: BaiduVoiceProfiler | None = hass.data.pop(DATA_PROFILER, None)
+            if profiler is None:
+                raise HomeAssistantError("Profiling is not running")
+
+            try:
+                files = await hass.async_add_executor_job(profiler.stop)
+            except HomeAssistantError:
+                # 保留已采集的数据, 以便再次调用停止服务重试
+                hass.data[DATA_PROFILER] = profiler
+                raise
+            return {"files": files}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_PROFILING,
+        _async_start_profiling,
+        schema=START_PROFILING_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_PROFILING,
+        _async_stop_profiling,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     return True
 
 
@@ -139,3 +139,13 @@ STT_DEFAULT_LANGUAGE: Final = "zh-CN"  # 默认使用普通话
 
 # 错误码
 ERROR_INVALID_AUTH: Final = "invalid_auth"
+
+# 性能分析
+DATA_PROFILER: Final = f"{DOMAIN}_profiler"
+SERVICE_START_PROFILING: Final = "start_profiling"
+SERVICE_STOP_PROFILING: Final = "stop_profiling"
+ATTR_CPROFILE: Final = "cprofile"
+PROFILER_MAX_SAMPLES: Final = 10000
+PROFILER_TOP_ALLOCATIONS: Final = 25
+PROFILER_TOP_FUNCTIONS: Final = 25
+PROFILER_TRACEMALLOC_FRAMES: Final = 10
@@ -0,0 +1,277 @@
+"""Opt-in profiling of the Baidu STT/TTS request paths."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import cProfile
+from fnmatch import fnmatch
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_PROFILER,
+    DOMAIN,
+    PROFILER_MAX_SAMPLES,
+    PROFILER_TOP_ALLOCATIONS,
+    PROFILER_TOP_FUNCTIONS,
+    PROFILER_TRACEMALLOC_FRAMES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_SOURCE_PATTERNS = (
+    os.path.join(_PACKAGE_DIR, "*"),
+    os.path.join("*", "aip", "*"),
+    os.path.join("*", "requests", "*"),
+)
+
+
+def get_profiler(hass: HomeAssistant) -> BaiduVoiceProfiler | None:
+    """Return the running profiler, or None when profiling is off."""
+    return hass.data.get(DATA_PROFILER)
+
+
+class BaiduVoiceProfiler:
+    """Collect timings, allocations and cProfile stats while enabled."""
+
+    def __init__(self, hass: HomeAssistant, use_cprofile: bool) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self._samples: deque[dict[str, Any]] = deque(maxlen=PROFILER_MAX_SAMPLES)
+        self._cprofile = cProfile.Profile() if use_cprofile else None
+        # Only one cProfile may be enabled at a time. From Python 3.12 it
+        # records every thread while enabled, not just the profiled job.
+        self._cprofile_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._owns_tracemalloc = False
+        # Taken after the first job so one-off imports and caches are excluded
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._baseline_pending = True
+        self._report: dict[str, Any] | None = None
+        self._started = dt_util.utcnow()
+        self._started_monotonic = time.monotonic()
+
+    def start(self) -> None:
+        """Start tracing allocations."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILER_TRACEMALLOC_FRAMES)
+            self._owns_tracemalloc = True
+
+    def call(self, kind: str, func: Callable[[], _T], **info: Any) -> _T:
+        """Run an executor job and record its wall and CPU time."""
+        with self._lock:
+            if self._stopped:
+                return func()
+
+        sample: dict[str, Any] = {"kind": kind, "cprofiled": False, "error": None}
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            result = self._run(func, sample)
+        except Exception as ex:
+            sample["error"] = type(ex).__name__
+            raise
+        else:
+            # Baidu reports API failures in the returned dict
+            if isinstance(result, dict) and result.get("err_no"):
+                sample["error"] = f"err_no {result['err_no']}"
+        finally:
+            sample.update(
+                {
+                    "offset": round(time.monotonic() - self._started_monotonic, 6),
+                    "wall": round(time.perf_counter() - wall_start, 6),
+                    "cpu": round(time.thread_time() - cpu_start, 6),
+                    **info,
+                }
+            )
+            with self._lock:
+                if not self._stopped:
+                    self._samples.append(sample)
+                    # Under the lock so stop() cannot end tracing meanwhile
+                    if self._baseline_pending and tracemalloc.is_tracing():
+                        self._baseline = _filter_snapshot(tracemalloc.take_snapshot())
+                    self._baseline_pending = False
+        return result
+
+    def _run(self, func: Callable[[], _T], sample: dict[str, Any]) -> _T:
+        """Run the job under cProfile unless another profiled job is running."""
+        # Overlapping jobs are only timed, see cprofile_skipped in the summary
+        if self._cprofile is None or not self._cprofile_lock.acquire(blocking=False):
+            return func()
+        try:
+            if self._stopped:
+                return func()
+            try:
+                self._cprofile.enable()
+            except ValueError:
+                # Another profiler, such as profiler.start, is already active
+                return func()
+            sample["cprofiled"] = True
+            try:
+                return func()
+            finally:
+                self._cprofile.disable()
+        finally:
+            self._cprofile_lock.release()
+
+    def stop(self) -> dict[str, str]:
+        """Stop profiling and write the results to the config directory."""
+        if self._report is None:
+            self._report = self._collect()
+
+        prefix = self.hass.config.path(
+            f"{DOMAIN}_profile_{self._started.strftime('%Y%m%d_%H%M%S_%f')}"
+        )
+        files = {"json": f"{prefix}.json"}
+        try:
+            if self._cprofile is not None:
+                files["prof"] = f"{prefix}.prof"
+                self._cprofile.dump_stats(files["prof"])
+            with open(files["json"], "w", encoding="utf-8") as file:
+                json.dump(self._report, file, ensure_ascii=False, indent=2)
+        except OSError as ex:
+            raise HomeAssistantError(
+                f"Failed to write profiling results, call stop_profiling again "
+                f"to retry: {ex}"
+            ) from ex
+
+        _LOGGER.info("Baidu Voice profiling results written to %s", files)
+        return files
+
+    def _collect(self) -> dict[str, Any]:
+        """Stop tracing and build the report from the collected data."""
+        with self._lock:
+            self._stopped = True
+
+        # Wait for an in-flight profiled job before reading its stats
+        with self._cprofile_lock:
+            snapshot = (
+                _filter_snapshot(tracemalloc.take_snapshot())
+                if tracemalloc.is_tracing()
+                else None
+            )
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+
+        samples = list(self._samples)
+        return {
+            "started": self._started.isoformat(),
+            "stopped": dt_util.utcnow().isoformat(),
+            "summary": _summarize(samples),
+            "samples": samples,
+            "cprofile_hot_spots": _cprofile_hot_spots(self._cprofile),
+            "allocations": _allocation_sites(snapshot),
+            "allocation_growth": _allocation_growth(snapshot, self._baseline),
+        }
+
+
+def _filter_snapshot(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    """Keep only allocations made from this integration and the Baidu client."""
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(True, pattern, all_frames=True)
+            for pattern in _SOURCE_PATTERNS
+        ]
+    )
+    # Leave out the profiler's own bookkeeping, such as the stored samples
+    return snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+
+
+def _cprofile_hot_spots(profile: cProfile.Profile | None) -> list[dict[str, Any]]:
+    """Return the slowest profiled functions from this integration and client."""
+    if profile is None:
+        return []
+    # The .prof covers every thread on Python 3.12+, this view does not
+    profile.create_stats()
+    hot_spots = [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "tottime": round(tottime, 6),
+            "cumtime": round(cumtime, 6),
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in (
+            profile.stats.items()
+        )
+        if filename != __file__
+        and any(fnmatch(filename, pattern) for pattern in _SOURCE_PATTERNS)
+    ]
+    hot_spots.sort(key=lambda spot: spot["cumtime"], reverse=True)
+    return hot_spots[:PROFILER_TOP_FUNCTIONS]
+
+
+def _summarize(samples: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Aggregate the samples per request kind."""
+    summary: dict[str, dict[str, Any]] = {}
+    for kind in sorted({sample["kind"] for sample in samples}):
+        walls = sorted(s["wall"] for s in samples if s["kind"] == kind)
+        cpus = [s["cpu"] for s in samples if s["kind"] == kind]
+        summary[kind] = {
+            "count": len(walls),
+            "wall_total": round(sum(walls), 6),
+            "wall_max": walls[-1],
+            "wall_p50": walls[len(walls) // 2],
+            "wall_p95": walls[min(len(walls) - 1, int(len(walls) * 0.95))],
+            "cpu_total": round(sum(cpus), 6),
+            "cpu_max": max(cpus),
+            "errors": sum(1 for s in samples if s["kind"] == kind and s["error"]),
+            "cprofile_skipped": sum(
+                1 for s in samples if s["kind"] == kind and not s["cprofiled"]
+            ),
+        }
+    return summary
+
+
+def _allocation_sites(
+    snapshot: tracemalloc.Snapshot | None,
+) -> list[dict[str, Any]]:
+    """Return the largest live allocation sites."""
+    if snapshot is None:
+        return []
+    return [
+        {
+            "traceback": stat.traceback.format(),
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("traceback")[:PROFILER_TOP_ALLOCATIONS]
+    ]
+
+
+def _allocation_growth(
+    snapshot: tracemalloc.Snapshot | None,
+    baseline: tracemalloc.Snapshot | None,
+) -> list[dict[str, Any]]:
+    """Return the allocation sites that grew the most since the first job."""
+    if snapshot is None or baseline is None:
+        return []
+    return [
+        {
+            "traceback": stat.traceback.format(),
+            "size_diff": stat.size_diff,
+            "count_diff": stat.count_diff,
+            "size": stat.size,
+        }
+        for stat in snapshot.compare_to(baseline, "traceback")[
+            :PROFILER_TOP_ALLOCATIONS
+        ]
+    ]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
+import time
 from typing import Any
 
 from aip import AipSpeech
@@ -26,6 +28,7 @@ from .const import (
     STT_DEFAULT_LANGUAGE,
     STT_LANGUAGES_CODE_MAP,
 )
+from .profiler import get_profiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,11 +96,12 @@ class BaiduSTTEntity(stt.SpeechToTextEntity):
     ) -> stt.SpeechResult:
         """Process an audio stream for speech recognition."""
         try:
+            stream_start = time.perf_counter()
             audio_data = b""
             async for chunk in stream:
                 audio_data += chunk
             _LOGGER.debug("Metadata: %s", metadata)
-            result = await self.hass.async_add_executor_job(
+            job = partial(
                 self._client.asr,
                 audio_data,
                 metadata.format,
@@ -109,6 +113,15 @@ class BaiduSTTEntity(stt.SpeechToTextEntity):
                     "channel": metadata.channel,
                 },
             )
+            if (profiler := get_profiler(self.hass)) is not None:
+                job = partial(
+                    profiler.call,
+                    "stt",
+                    job,
+                    audio_bytes=len(audio_data),
+                    stream_wall=round(time.perf_counter() - stream_start, 6),
+                )
+            result = await self.hass.async_add_executor_job(job)
 
             if not isinstance(result, dict):
                 return stt.SpeechResult(
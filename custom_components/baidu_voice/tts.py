@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any
 
@@ -31,6 +32,7 @@ from .const import (
     TTS_LANGUAGES,
     TTS_SUPPORTED_VOICES,
 )
+from .profiler import get_profiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -161,12 +163,19 @@ class BaiduTTSEntity(TextToSpeechEntity):
         _LOGGER.debug("API parameters: %s", api_params)
 
         try:
-            result = self._client.synthesis(
+            synthesize = partial(
+                self._client.synthesis,
                 message,
                 language,
                 1,  # Use standard voice synthesis
                 api_params,
             )
+            if (profiler := get_profiler(self.hass)) is not None:
+                result = profiler.call(
+                    "tts", synthesize, message_length=len(message), per=voice
+                )
+            else:
+                result = synthesize()
 
             if isinstance(result, dict):
                 error_msg = result.get("err_msg", "Unknown error")